@@ -8,7 +8,7 @@ de l'application.
 Constantes:
     - DOSSIER_BASE: Répertoire de base de l'application, défini comme le dossier contenant ce fichier de configuration.
     - FICHIER_UTILISATEURS: Chemin vers le fichier stockant les informations des utilisateurs (utilisateurs.json).
-    - FICHIER_PROPRIETES: Chemin vers le fichier stockant les informations des propriétés (proprietes.json).
+    - FICHIER_PROPRIETES: Chemin vers le fichier stockant les informations des propriétés (proprietes.jsonl).
     - FICHIER_SESSION: Chemin vers le fichier stockant la session active (session.txt).
 
 Dépendances:
@@ -23,8 +23,10 @@ DOSSIER_BASE = Path(__file__).resolve().parent
 # Chemin vers le fichier stockant les informations des utilisateurs.
 FICHIER_UTILISATEURS = DOSSIER_BASE / "utilisateurs.json"
 
-# Chemin vers le fichier stockant les informations des propriétés..
-FICHIER_PROPRIETES = DOSSIER_BASE / "proprietes.json"
+# Chemin vers le fichier stockant les informations des propriétés, au format
+# JSON Lines (une propriété par ligne), ce qui permet d'ajouter une propriété
+# sans réécrire le fichier au complet.
+FICHIER_PROPRIETES = DOSSIER_BASE / "proprietes.jsonl"
 
 # Chemin vers le fichier stockant la session active.
 FICHIER_SESSION = DOSSIER_BASE / "session.txt"
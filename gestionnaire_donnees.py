@@ -5,17 +5,87 @@ incluant le chargement et la sauvegarde des utilisateurs et des propriétés dan
 Fonctions:
 - `charger_utilisateurs()`: Charge les utilisateurs depuis le fichier des utilisateurs.
 - `sauvegarder_utilisateurs(utilisateurs)`: Sauvegarde les utilisateurs dans le fichier des utilisateurs.
+- `recuperer_utilisateur(nom_utilisateur)`: Récupère le hachage du mot de passe d'un seul utilisateur.
 - `charger_proprietes()`: Charge toutes les propriétés depuis le fichier des propriétés.
+- `charger_proprietes_colonnes()`: Retourne les propriétés sous forme de colonnes parallèles.
+- `index_proprietes()`: Retourne des index en mémoire des propriétés (par ville et par prix).
+- `iter_proprietes(predicat)`: Parcourt les propriétés une à une, sans construire la liste complète.
 - `sauvegarder_propriete(new_property)`: Sauvegarde une nouvelle propriété.
 
 Dépendances:
 - `json`: Pour lire et écrire des fichiers JSON.
+- `orjson` (facultatif): Analyseur JSON en C, nettement plus rapide que le module
+  standard; utilisé automatiquement s'il est installé.
+- `simdjson` (facultatif, paquet pysimdjson): Analyseur JSON vectorisé (SIMD), utilisé
+  pour l'analyse si orjson est absent.
+- `os`: Pour consulter la date de modification des fichiers (gestion du cache).
 - `configuration`: Pour accéder à des constantes globales comme les chemins des fichiers.
+
+Note:
+    Les fonctions de chargement maintiennent un cache en mémoire pour éviter de relire
+    et de réanalyser les fichiers à chaque appel. Le cache est invalidé automatiquement
+    si le fichier est modifié sur disque (comparaison de la date de modification), et il est
+    mis à jour directement lors des sauvegardes.
 """
 
 import json
+import os
 from configuration import FICHIER_UTILISATEURS, FICHIER_PROPRIETES
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson  # paquet pysimdjson
+except ImportError:
+    simdjson = None
+
+# Fonctions d'analyse et de sérialisation JSON: celles d'orjson si disponible,
+# sinon l'analyseur SIMD de pysimdjson (analyse seulement), sinon le module
+# standard. Toutes acceptent des octets en entrée.
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(objet):
+        return orjson.dumps(objet).decode()
+
+else:
+    _json_loads = json.loads if simdjson is None else simdjson.loads
+
+    def _json_dumps(objet):
+        # Comme orjson: accents écrits tels quels plutôt qu'en séquences
+        # d'échappement \uXXXX (sortie plus courte et encodage plus rapide),
+        # et aucune espace après les séparateurs.
+        return json.dumps(objet, ensure_ascii=False, separators=(",", ":"))
+
+# Caches en mémoire pour éviter de relire les fichiers à chaque appel.
+# "mtime" contient la date de modification (en nanosecondes) du fichier au moment
+# du dernier chargement, et "data" le contenu déjà analysé.
+_cache_utilisateurs = {"mtime": None, "data": None}
+_cache_proprietes = {"mtime": None, "data": None}
+_cache_colonnes = {"mtime": None, "data": None}
+_cache_index = {"mtime": None, "data": None}
+
+# Champs d'une propriété, dans l'ordre utilisé par la vue en colonnes.
+COLONNES_PROPRIETES = ("prix", "ville", "type", "chambres", "salles de bains")
+
+
+def _date_de_modification(chemin):
+    """Retourne la date de modification d'un fichier, en nanosecondes.
+
+    Args:
+        chemin (Path): Le chemin du fichier à consulter.
+
+    Returns:
+        int: La date de modification du fichier, ou None si le fichier n'existe pas.
+    """
+    try:
+        return os.stat(chemin).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 
 def charger_utilisateurs():
     """Charge les utilisateurs depuis le fichier des utilisateurs.
@@ -23,12 +93,20 @@ def charger_utilisateurs():
     Returns:
         dict: Un dictionnaire des utilisateurs avec leurs mots de passe hachés.
     """
-    try:
-        with open(FICHIER_UTILISATEURS, "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
+    mtime = _date_de_modification(FICHIER_UTILISATEURS)
+    if mtime is None:
+        _cache_utilisateurs["mtime"] = None
+        _cache_utilisateurs["data"] = None
         return {}
 
+    if mtime == _cache_utilisateurs["mtime"]:
+        return _cache_utilisateurs["data"]
+
+    utilisateurs = _json_loads(FICHIER_UTILISATEURS.read_bytes())
+    _cache_utilisateurs["mtime"] = mtime
+    _cache_utilisateurs["data"] = utilisateurs
+    return utilisateurs
+
 
 def sauvegarder_utilisateurs(utilisateurs):
     """Sauvegarde les utilisateurs dans le fichier des utilisateurs.
@@ -36,8 +114,26 @@ def sauvegarder_utilisateurs(utilisateurs):
     Args:
         utilisateurs (dict): Un dictionnaire des utilisateurs avec leurs mots de passe hachés.
     """
-    with open(FICHIER_UTILISATEURS, "w") as f:
-        json.dump(utilisateurs, f)
+    with open(FICHIER_UTILISATEURS, "w", encoding="utf-8") as f:
+        f.write(_json_dumps(utilisateurs))
+    _cache_utilisateurs["mtime"] = _date_de_modification(FICHIER_UTILISATEURS)
+    _cache_utilisateurs["data"] = utilisateurs
+
+
+def recuperer_utilisateur(nom_utilisateur):
+    """Récupère le hachage du mot de passe d'un seul utilisateur.
+
+    Le fichier des utilisateurs est un dictionnaire indexé par nom: une fois le
+    cache chaud, la recherche est un simple accès par clé, sans reparcourir ni
+    recopier l'ensemble des comptes.
+
+    Args:
+        nom_utilisateur (str): Le nom de l'utilisateur recherché.
+
+    Returns:
+        str: Le hachage du mot de passe de l'utilisateur, ou None s'il n'existe pas.
+    """
+    return charger_utilisateurs().get(nom_utilisateur)
 
 
 def charger_proprietes():
@@ -46,25 +142,135 @@ def charger_proprietes():
     Returns:
         list: Liste des propriétés.
     """
-    try:
-        with open(FICHIER_PROPRIETES, "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
+    mtime = _date_de_modification(FICHIER_PROPRIETES)
+    if mtime is None:
+        _cache_proprietes["mtime"] = None
+        _cache_proprietes["data"] = None
         return []
 
+    if mtime == _cache_proprietes["mtime"]:
+        return _cache_proprietes["data"]
+
+    proprietes = [
+        _json_loads(ligne)
+        for ligne in FICHIER_PROPRIETES.read_bytes().splitlines()
+        if ligne.strip()
+    ]
+    _cache_proprietes["mtime"] = mtime
+    _cache_proprietes["data"] = proprietes
+    return proprietes
+
+
+def charger_proprietes_colonnes():
+    """Retourne les propriétés sous forme de colonnes parallèles.
+
+    Plutôt qu'une liste de dictionnaires (une entrée par propriété), cette vue
+    regroupe les valeurs champ par champ: une liste par colonne, toutes de même
+    longueur. Parcourir une colonne évite alors une recherche de clé par
+    propriété. La vue est dérivée du cache des propriétés et reconstruite
+    seulement quand celui-ci change.
+
+    Returns:
+        dict: Un dictionnaire associant chaque nom de colonne (voir
+            COLONNES_PROPRIETES) à la liste de ses valeurs.
+    """
+    proprietes = charger_proprietes()
+    mtime = _cache_proprietes["mtime"]
+    if mtime is not None and mtime == _cache_colonnes["mtime"]:
+        return _cache_colonnes["data"]
+
+    colonnes = {
+        nom: [propriete[nom] for propriete in proprietes]
+        for nom in COLONNES_PROPRIETES
+    }
+    _cache_colonnes["mtime"] = mtime
+    _cache_colonnes["data"] = colonnes
+    return colonnes
+
+
+def index_proprietes():
+    """Retourne des index en mémoire des propriétés, par ville et par prix.
+
+    L'index par ville associe chaque ville à la liste de ses propriétés
+    (recherche en temps constant); l'index par prix est la liste des propriétés
+    triée par prix, accompagnée de la liste des prix seuls pour permettre des
+    recherches de plage par dichotomie (module `bisect`). Comme la vue en
+    colonnes, ces index sont dérivés du cache des propriétés et reconstruits
+    seulement quand celui-ci change.
+
+    Returns:
+        dict: Un dictionnaire avec les clés "par_ville" (dict ville -> liste de
+            propriétés), "par_prix" (liste de propriétés triée par prix) et
+            "prix_tries" (liste des prix, triée).
+    """
+    proprietes = charger_proprietes()
+    mtime = _cache_proprietes["mtime"]
+    if mtime is not None and mtime == _cache_index["mtime"]:
+        return _cache_index["data"]
+
+    par_ville = {}
+    for propriete in proprietes:
+        par_ville.setdefault(propriete["ville"], []).append(propriete)
+    par_prix = sorted(proprietes, key=lambda propriete: propriete["prix"])
+    index = {
+        "par_ville": par_ville,
+        "par_prix": par_prix,
+        "prix_tries": [propriete["prix"] for propriete in par_prix],
+    }
+    _cache_index["mtime"] = mtime
+    _cache_index["data"] = index
+    return index
+
+
+def iter_proprietes(predicat=None):
+    """Parcourt les propriétés une à une, sans construire la liste complète.
+
+    Contrairement à `charger_proprietes`, cette fonction lit le fichier ligne par
+    ligne et ne matérialise que les propriétés retenues par le prédicat, ce qui
+    limite la mémoire utilisée pour les gros fichiers. Si le cache est à jour,
+    les propriétés déjà chargées sont parcourues directement.
+
+    Args:
+        predicat (callable, optional): Fonction recevant une propriété et retournant
+            True si elle doit être retenue. Si None, toutes les propriétés sont produites.
+
+    Yields:
+        dict: Les propriétés retenues, une à la fois.
+    """
+    mtime = _date_de_modification(FICHIER_PROPRIETES)
+    if mtime is None:
+        return
+
+    if mtime == _cache_proprietes["mtime"]:
+        proprietes = _cache_proprietes["data"]
+    else:
+        proprietes = _iter_fichier_proprietes()
+
+    for propriete in proprietes:
+        if predicat is None or predicat(propriete):
+            yield propriete
+
+
+def _iter_fichier_proprietes():
+    """Lit le fichier des propriétés ligne par ligne et produit chaque propriété."""
+    with open(FICHIER_PROPRIETES, "rb") as f:
+        for ligne in f:
+            if ligne.strip():
+                yield _json_loads(ligne)
+
 
 def sauvegarder_propriete(nouvelle_propriete):
     """Sauvegarde une nouvelle propriété.
 
+    La propriété est ajoutée à la fin du fichier (une ligne JSON par propriété),
+    ce qui évite de recharger et de réécrire toutes les propriétés existantes.
+
     Args:
         nouvelle_propriete (dict): Dictionnaire contenant les informations de la nouvelle propriété.
     """
-    try:
-        with open(FICHIER_PROPRIETES, "r") as f:
-            proprietes = json.load(f)
-    except FileNotFoundError:
-        proprietes = []
-
+    proprietes = charger_proprietes()
+    with open(FICHIER_PROPRIETES, "a", encoding="utf-8") as f:
+        f.write(_json_dumps(nouvelle_propriete) + "\n")
     proprietes.append(nouvelle_propriete)
-    with open(FICHIER_PROPRIETES, "w") as f:
-        json.dump(proprietes, f)
+    _cache_proprietes["mtime"] = _date_de_modification(FICHIER_PROPRIETES)
+    _cache_proprietes["data"] = proprietes
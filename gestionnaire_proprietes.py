@@ -14,7 +14,14 @@ Dépendances:
 et le formatage de montants en dollars.
 """
 
-from gestionnaire_donnees import charger_proprietes, sauvegarder_propriete
+from bisect import bisect_left, bisect_right
+
+from gestionnaire_donnees import (
+    charger_proprietes_colonnes,
+    index_proprietes,
+    iter_proprietes,
+    sauvegarder_propriete,
+)
 from gestionnaire_utilisateurs import recuperer_utilisateur_courant, utilisateur_est_connecte
 from utilitaires import afficher_tableau, formater_argent, afficher_banniere
 
@@ -22,27 +29,34 @@ from utilitaires import afficher_tableau, formater_argent, afficher_banniere
 TYPES_DE_PROPRIETE = ["Maison", "Appartement", "Condo", "Studio"]
 VILLES = ["Québec", "Montréal", "Toronto", "Ottawa"]
 
+# Ensembles dérivés des listes ci-dessus pour les tests d'appartenance: la
+# recherche dans un ensemble est en temps constant, alors qu'une liste est
+# parcourue élément par élément à chaque saisie invalide.
+_TYPES_DE_PROPRIETE_VALIDES = frozenset(TYPES_DE_PROPRIETE)
+_VILLES_VALIDES = frozenset(VILLES)
+
 
 def lister_proprietes():
     """Liste toutes les propriétés disponibles."""
-    proprietes = charger_proprietes()
-    
-    if not proprietes:
+    colonnes = charger_proprietes_colonnes()
+
+    if not colonnes["ville"]:
         print("Aucune propriété disponible.")
         return
-    
-    # Formater les propriétés pour l'affichage
-    proprietes_formatees = [
-        [
-            propriete["ville"],
-            propriete["type"],
-            propriete["chambres"],
-            propriete["salles de bains"],
-            formater_argent(propriete["prix"])
-        ]
-        for propriete in proprietes
-    ]
-    
+
+    # Formater les propriétés pour l'affichage: les colonnes parallèles sont
+    # recombinées en lignes, sans recherche de clé par propriété, et les prix
+    # sont formatés en lot avec map plutôt que dans une boucle explicite.
+    proprietes_formatees = list(
+        zip(
+            colonnes["ville"],
+            colonnes["type"],
+            colonnes["chambres"],
+            colonnes["salles de bains"],
+            map(formater_argent, colonnes["prix"]),
+        )
+    )
+
     # Afficher le tableau des propriétés
     en_tetes = ["Ville", "Type", "Chambres", "Salles de Bains", "Prix"]
     afficher_tableau(proprietes_formatees, en_tetes)
@@ -50,7 +64,6 @@ def lister_proprietes():
 
 def filtrer_proprietes():
     """Filtre les propriétés en fonction de critères donnés par l'utilisateur."""
-    proprietes = charger_proprietes()
     critere_ville = input("Ville (laisser vide pour ignorer): ").strip()
     critere_prix_min = input("Prix minimum (laisser vide pour ignorer): ").strip()
     critere_prix_max = input("Prix maximum (laisser vide pour ignorer): ").strip()
@@ -60,23 +73,37 @@ def filtrer_proprietes():
         critere_prix_min = float(critere_prix_min)
     if critere_prix_max:
         critere_prix_max = float(critere_prix_max)
-    if critere_chambres:
-        critere_chambres = int(critere_chambres)
-
-    proprietes_filtrees = []
-    for propriete in proprietes:
-        if critere_ville and propriete["ville"] != critere_ville:
-            continue
-        if critere_prix_min and propriete["prix"] < critere_prix_min:
-            continue
-        if critere_prix_max and propriete["prix"] > critere_prix_max:
-            continue
-        if critere_chambres and propriete["chambres"] < critere_chambres:
-            continue
-        proprietes_filtrees.append(propriete)
 
-    for propriete in proprietes_filtrees:
-        print(propriete)
+    # Seuls les critères renseignés donnent lieu à un test: les critères vides
+    # sont éliminés ici, une seule fois, plutôt que d'être réévalués pour
+    # chacune des propriétés parcourues.
+    tests = []
+    if critere_chambres:
+        chambres_min = int(critere_chambres)
+        tests.append(lambda propriete: propriete["chambres"] >= chambres_min)
+
+    # Le critère le plus sélectif est résolu par les index en mémoire plutôt
+    # qu'en parcourant tout le catalogue: recherche directe par ville, ou
+    # dichotomie sur les prix triés pour une plage de prix. Sans critère
+    # indexé, on retombe sur le parcours en flux.
+    if critere_ville:
+        candidats = index_proprietes()["par_ville"].get(critere_ville, [])
+        if critere_prix_min:
+            tests.append(lambda propriete: propriete["prix"] >= critere_prix_min)
+        if critere_prix_max:
+            tests.append(lambda propriete: propriete["prix"] <= critere_prix_max)
+    elif critere_prix_min or critere_prix_max:
+        index = index_proprietes()
+        prix_tries = index["prix_tries"]
+        debut = bisect_left(prix_tries, critere_prix_min) if critere_prix_min else 0
+        fin = bisect_right(prix_tries, critere_prix_max) if critere_prix_max else len(prix_tries)
+        candidats = index["par_prix"][debut:fin]
+    else:
+        candidats = iter_proprietes()
+
+    for propriete in candidats:
+        if all(test(propriete) for test in tests):
+            print(propriete)
 
 def ajouter_propriete():
     """Ajoute une nouvelle propriété."""
@@ -85,11 +112,30 @@ def ajouter_propriete():
         print("Vous devez être connecté pour ajouter une propriété.")
         return
 
-    prix = float(input("Prix: "))
-    ville = input("Ville: ").strip()
-    type_propriete = input("Type (Maison, Condo, etc.): ").strip()
-    chambres = int(input("Nombre de chambres: "))
-    salles_de_bain = int(input("Nombre de salles de bain: "))
+    # Une seule saisie multi-champs remplace cinq allers-retours avec input():
+    # la ligne est découpée sur les points-virgules puis validée champ par champ.
+    print(
+        "Entrez la propriété sous la forme: Prix; Ville; Type; Chambres; Salles de bain"
+    )
+    while True:
+        champs = [champ.strip() for champ in input("Propriété: ").split(";")]
+        if len(champs) != 5:
+            print(
+                "Saisie invalide. Cinq champs séparés par des points-virgules sont attendus."
+            )
+            continue
+        try:
+            prix = float(champs[0])
+            chambres = int(champs[3])
+            salles_de_bain = int(champs[4])
+        except ValueError:
+            print(
+                "Saisie invalide. Le prix et les nombres de pièces doivent être numériques."
+            )
+            continue
+        ville = champs[1]
+        type_propriete = champs[2]
+        break
 
     nouvelle_propriete = {
         "prix": prix,
@@ -146,7 +192,7 @@ def demander_ville(optionnel=False):
         ville = input("Ville: ")
         if optionnel and not ville:
             return None
-        if ville in VILLES:
+        if ville in _VILLES_VALIDES:
             return ville
         print(f"Ville invalide. Choisissez parmi: {', '.join(VILLES)}")
 
@@ -167,7 +213,7 @@ def demander_type_de_propriete(optionnel=False):
         type_de_propriete = input("Type de propriété: ")
         if optionnel and not type_de_propriete:
             return None
-        if type_de_propriete in TYPES_DE_PROPRIETE:
+        if type_de_propriete in _TYPES_DE_PROPRIETE_VALIDES:
             return type_de_propriete
         print(
             f"Type de propriété invalide. Choisissez parmi: {', '.join(TYPES_DE_PROPRIETE)}"
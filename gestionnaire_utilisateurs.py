@@ -15,38 +15,90 @@ Fonctions:
 
 Dépendances:
 - `secrets`: Pour comparer les hachages (https://docs.python.org/3/library/secrets.html#secrets.compare_digest).
+- `os`: Pour consulter la date de modification du fichier de session (gestion du cache)
+  et écrire dans celui-ci via un descripteur gardé ouvert.
 - `gestionnaire_donnees`: Pour lire et écrire dans le fichier des utilisateurs.
-- `utilitaires`: Pour hacher les mots de passe.
+- `utilitaires`: Pour hacher et vérifier les mots de passe.
 - `configuration`: Pour accéder au chemin du fichier de session.
 """
 
+import os
 import secrets
-from gestionnaire_donnees import charger_utilisateurs, sauvegarder_utilisateurs
-from utilitaires import hacher_mot_de_passe
+from gestionnaire_donnees import (
+    charger_utilisateurs,
+    recuperer_utilisateur,
+    sauvegarder_utilisateurs,
+)
+from utilitaires import hacher_mot_de_passe, verifier_mot_de_passe
 from configuration import FICHIER_SESSION
 
+# Cache en mémoire du fichier de session, consulté à chaque itération du menu.
+# "mtime" contient la date de modification (en nanosecondes) du fichier au moment
+# de la dernière lecture, et "utilisateur" le nom d'utilisateur correspondant.
+_cache_session = {"mtime": None, "utilisateur": None}
 
-def recuperer_utilisateur_courant():
-    """Récupère l'utilisateur actuellement connecté."""
+# Descripteur du fichier de session, ouvert paresseusement puis gardé ouvert
+# pour la durée du programme: les écritures suivantes évitent le coût
+# d'ouverture/fermeture du fichier à chaque connexion ou déconnexion.
+_descripteur_session = None
+
+
+def _ecrire_session(texte):
+    """Écrit le contenu du fichier de session via un descripteur gardé ouvert.
+
+    Args:
+        texte (str): Le contenu à écrire (nom d'utilisateur, ou chaîne vide).
+    """
+    global _descripteur_session
+    if _descripteur_session is None:
+        _descripteur_session = os.open(FICHIER_SESSION, os.O_RDWR | os.O_CREAT, 0o644)
+    donnees = texte.encode()
+    os.pwrite(_descripteur_session, donnees, 0)
+    os.ftruncate(_descripteur_session, len(donnees))
+
+
+def _date_de_modification_session():
+    """Retourne la date de modification du fichier de session, en nanosecondes.
+
+    Returns:
+        int: La date de modification du fichier, ou None si le fichier n'existe pas.
+    """
     try:
-        with open(FICHIER_SESSION, "r") as f:
-            if f.read().strip() == "":
-                return None
-            else:
-                return f.read().strip()
+        return os.stat(FICHIER_SESSION).st_mtime_ns
     except FileNotFoundError:
         return None
 
+
+def recuperer_utilisateur_courant():
+    """Récupère l'utilisateur actuellement connecté."""
+    mtime = _date_de_modification_session()
+    if mtime is None:
+        _cache_session["mtime"] = None
+        _cache_session["utilisateur"] = None
+        return None
+
+    if mtime == _cache_session["mtime"]:
+        return _cache_session["utilisateur"]
+
+    with open(FICHIER_SESSION, "r") as f:
+        contenu = f.read().strip()
+    _cache_session["mtime"] = mtime
+    _cache_session["utilisateur"] = contenu or None
+    return _cache_session["utilisateur"]
+
+
 def definir_utilisateur_courant(nom_utilisateur):
     """Définit l'utilisateur actuellement connecté."""
-    with open(FICHIER_SESSION, "w") as f:
-        f.write(nom_utilisateur)
+    _ecrire_session(nom_utilisateur)
+    _cache_session["mtime"] = _date_de_modification_session()
+    _cache_session["utilisateur"] = nom_utilisateur or None
 
 
 def vider_session():
     """Efface les informations de session de l'utilisateur actuellement connecté."""
-    with open(FICHIER_SESSION, "w") as f:
-        f.write("")
+    _ecrire_session("")
+    _cache_session["mtime"] = _date_de_modification_session()
+    _cache_session["utilisateur"] = None
 
 
 def creer_compte():
@@ -65,12 +117,10 @@ def creer_compte():
 
 def se_connecter():
     """Connecte un utilisateur existant."""
-    utilisateurs = charger_utilisateurs()
     nom_utilisateur = input("Nom d'utilisateur: ").strip()
     mot_de_passe = input("Mot de passe: ").strip()
-    mot_de_passe_hache = hacher_mot_de_passe(mot_de_passe)
 
-    if utilisateurs.get(nom_utilisateur) == mot_de_passe_hache:
+    if verifier_mot_de_passe(mot_de_passe, recuperer_utilisateur(nom_utilisateur)):
         definir_utilisateur_courant(nom_utilisateur)
         print("Connexion réussie.")
     else:
@@ -43,10 +43,14 @@ def main():
 
     continuer = True
     while continuer:
+        # L'état de connexion est vérifié une seule fois par itération: le même
+        # résultat sert à l'affichage du menu et au traitement du choix.
+        connecte = utilisateur_est_connecte()
+
         print("\nOptions:")
         print("1. Lister les propriétés")
         print("2. Filtrer les propriétés")
-        if utilisateur_est_connecte():
+        if connecte:
             print("3. Ajouter une propriété")
             print("4. Déconnexion")
         else:
@@ -60,11 +64,11 @@ def main():
             lister_proprietes()
         elif choix == "2":
             filtrer_proprietes()
-        elif choix == "3" and utilisateur_est_connecte():
+        elif choix == "3" and connecte:
             ajouter_propriete()
         elif choix == "3":
             creer_compte()
-        elif choix == "4" and utilisateur_est_connecte():
+        elif choix == "4" and connecte:
             se_deconnecter()
         elif choix == "4":
             se_connecter()
@@ -4,42 +4,97 @@ couvrant diverses fonctionnalités telles que le hachage de mots de passe, le fo
 monétaires et l'affichage de données sous forme de tableaux.
 
 Fonctions:
-- `hacher_mot_de_passe(mot_de_passe)`: Hache un mot de passe en utilisant l'algorithme SHA-256.
+- `hacher_mot_de_passe(mot_de_passe)`: Hache un mot de passe avec scrypt et un sel aléatoire.
+- `verifier_mot_de_passe(mot_de_passe, hachage)`: Vérifie un mot de passe contre un hachage enregistré.
 - `formater_argent(montant_en_dollars)`: Convertit un montant en dollars en une chaîne formatée.
 - `afficher_banniere(titre)`: Affiche une bannière contenant un titre centré.
 - `afficher_tableau(lignes, en_tetes)`: Affiche des données sous forme de tableau dans la console.
 
 Dépendances:
-- `hashlib`: Nécessaire pour le hachage de mots de passe en utilisant SHA-256.
-- `secrets`: Pour comparer les hachages (https://docs.python.org/3/library/secrets.html#secrets.compare_digest).
+- `functools`: Pour mémoïser la construction des bannières.
+- `hashlib`: Nécessaire pour le hachage de mots de passe en utilisant scrypt (et SHA-256
+  pour les hachages hérités).
+- `secrets`: Pour générer les sels aléatoires et comparer les hachages
+  (https://docs.python.org/3/library/secrets.html#secrets.compare_digest).
 
 Note:
     Les fonctions de ce module sont conçues pour être réutilisables et facilement intégrables dans divers points de
     l'application, contribuant à la modularité et à la maintenance du code.
 """
 
+import functools
 import hashlib
 import secrets
 
+# Constructeur SHA-256 lié une seule fois au chargement du module: l'appel
+# direct évite une recherche d'attribut dans hashlib à chaque hachage et
+# emprunte le chemin "one-shot" d'OpenSSL (accéléré matériellement via les
+# instructions SHA quand le processeur les offre). Sert à vérifier les
+# hachages hérités (comptes créés avant le passage à scrypt).
+_sha256 = hashlib.sha256
+
+# Paramètres scrypt: coût CPU/mémoire (n), taille de bloc (r), parallélisme (p)
+# et longueur du sel en octets. Valeurs recommandées par la documentation de
+# hashlib pour le stockage de mots de passe.
+_SCRYPT_N = 2**14
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_TAILLE_SEL = 16
+
 
 def hacher_mot_de_passe(mot_de_passe):
-    """Hache un mot de passe en utilisant l'algorithme SHA-256.
+    """Hache un mot de passe en utilisant l'algorithme scrypt.
 
-    Cette fonction prend un mot de passe en clair comme entrée et retourne
-    son hash SHA-256, offrant une forme sécurisée pour stocker ou comparer
-    des mots de passe.
+    Cette fonction prend un mot de passe en clair comme entrée et retourne son
+    hachage scrypt, précédé d'un sel aléatoire. Contrairement à un simple
+    SHA-256, scrypt est volontairement coûteux en calcul et en mémoire, et le
+    sel garantit que deux hachages du même mot de passe sont différents, ce qui
+    résiste aux attaques par dictionnaire précalculé.
 
     Args:
         mot_de_passe (str): Le mot de passe en clair à hacher.
 
     Returns:
-        str: Le hash SHA-256 du mot de passe.
+        str: Le hachage, sous la forme "scrypt$<sel en hexadécimal>$<hachage en hexadécimal>".
+    """
+    sel = secrets.token_bytes(_TAILLE_SEL)
+    hachage = hashlib.scrypt(
+        mot_de_passe.encode(), salt=sel, n=_SCRYPT_N, r=_SCRYPT_R, p=_SCRYPT_P
+    )
+    return f"scrypt${sel.hex()}${hachage.hex()}"
 
-    Exemple:
-        >>> hacher_mot_de_passe("motdepasse123")
-        '75216c44a46bfff78f692d1fe695c02a407a2136625dcc17ca6cf3141e0c4c72'
+
+def verifier_mot_de_passe(mot_de_passe, hachage):
+    """Vérifie qu'un mot de passe correspond à un hachage enregistré.
+
+    Les hachages produits par `hacher_mot_de_passe` (format
+    "scrypt$<sel>$<hachage>") sont vérifiés en recalculant scrypt avec le même
+    sel. Les hachages SHA-256 hérités (comptes créés avec une version
+    antérieure de l'application) restent acceptés.
+
+    Args:
+        mot_de_passe (str): Le mot de passe en clair à vérifier.
+        hachage (str): Le hachage enregistré.
+
+    Returns:
+        bool: True si le mot de passe correspond au hachage, False sinon.
     """
-    return hashlib.sha256(mot_de_passe.encode()).hexdigest()
+    if not hachage:
+        return False
+
+    if hachage.startswith("scrypt$"):
+        _, sel_hexadecimal, hachage_attendu = hachage.split("$")
+        hachage_calcule = hashlib.scrypt(
+            mot_de_passe.encode(),
+            salt=bytes.fromhex(sel_hexadecimal),
+            n=_SCRYPT_N,
+            r=_SCRYPT_R,
+            p=_SCRYPT_P,
+        )
+        return secrets.compare_digest(hachage_calcule.hex(), hachage_attendu)
+
+    # Hachage hérité: SHA-256 sans sel.
+    return secrets.compare_digest(_sha256(mot_de_passe.encode()).hexdigest(), hachage)
 
 
 def formater_argent(montant_en_dollars):
@@ -66,7 +121,25 @@ def formater_argent(montant_en_dollars):
         >>> formater_argent(0.99)
         '0.99 $'
     """
-    return "{:,.2f} $".format(montant_en_dollars)
+    return f"{montant_en_dollars:,.2f} $"
+
+
+@functools.lru_cache(maxsize=None)
+def _construire_banniere(titre):
+    """Construit le texte d'une bannière contenant un titre centré.
+
+    Le résultat est mémoïsé: les bannières étant construites à partir de titres
+    fixes, chacune n'est assemblée qu'une seule fois par exécution.
+
+    Args:
+        titre (str): Le titre à afficher au centre de la bannière.
+
+    Returns:
+        str: Les trois lignes de la bannière.
+    """
+    largeur_banniere = len(titre) + 20
+    bordure = largeur_banniere * "#"
+    return f"{bordure}\n{titre:^{largeur_banniere}}\n{bordure}"
 
 
 def afficher_banniere(titre):
@@ -75,10 +148,7 @@ def afficher_banniere(titre):
     Args:
         titre (str): Le titre à afficher au centre de la bannière.
     """
-    largeur_banniere = len(titre) + 20
-    print(largeur_banniere * "#")
-    print(f"{titre:^{largeur_banniere}}")
-    print(largeur_banniere * "#")
+    print(_construire_banniere(titre))
 
 
 def afficher_tableau(lignes, en_tetes):
@@ -102,11 +172,14 @@ def afficher_tableau(lignes, en_tetes):
         |  Bob  |  25 |
         +-------+-----+
     """
-    # Trouver la largeur maximale de chaque colonne
-    largeurs = [
-        len(max([str(ligne[idx]) for ligne in lignes] + [en_tete], key=len))
-        for idx, en_tete in enumerate(en_tetes)
-    ]
+    # Convertir chaque cellule en chaîne une seule fois, puis trouver la largeur
+    # maximale de chaque colonne en un seul passage sur les lignes.
+    lignes_texte = [[str(item) for item in ligne] for ligne in lignes]
+    largeurs = [len(en_tete) for en_tete in en_tetes]
+    for ligne in lignes_texte:
+        for idx, texte in enumerate(ligne):
+            if len(texte) > largeurs[idx]:
+                largeurs[idx] = len(texte)
 
     # Créer la ligne d'en-tête
     en_tete_formate = " | ".join(
@@ -122,9 +195,9 @@ def afficher_tableau(lignes, en_tetes):
     print(ligne_separation)
 
     # Afficher chaque ligne de données
-    for ligne in lignes:
+    for ligne in lignes_texte:
         ligne_formatee = " | ".join(
-            str(item).center(largeurs[idx]) for idx, item in enumerate(ligne)
+            texte.center(largeurs[idx]) for idx, texte in enumerate(ligne)
         )
         print("| " + ligne_formatee + " |")
 
@@ -136,37 +209,48 @@ def tests_hacher_mot_de_passe():
     mot_de_passe = "secret"
     assert hacher_mot_de_passe(mot_de_passe) is not None
 
-    # Teste si le hash a une longueur de 64 caractères.
+    # Teste le format du hachage: "scrypt$<sel>$<hachage>".
     mot_de_passe = "secret"
-    assert len(hacher_mot_de_passe(mot_de_passe)) == 64
+    hachage = hacher_mot_de_passe(mot_de_passe)
+    prefixe, sel, empreinte = hachage.split("$")
+    assert prefixe == "scrypt"
+    assert len(sel) == 2 * _TAILLE_SEL
+    assert len(empreinte) == 128
 
-    # Teste la consistance du hash pour le même mot de passe.
+    # Teste qu'un mot de passe est vérifiable contre son propre hachage.
+    mot_de_passe = "secret"
+    hachage = hacher_mot_de_passe(mot_de_passe)
+    assert verifier_mot_de_passe(mot_de_passe, hachage)
+
+    # Teste que deux hachages du même mot de passe sont différents (sel
+    # aléatoire), mais que les deux restent vérifiables.
     mot_de_passe = "secret"
     hachage_1 = hacher_mot_de_passe(mot_de_passe)
     hachage_2 = hacher_mot_de_passe(mot_de_passe)
-    # Note: La fonction `secrets.compare_digest` est spécialement conçue pour résister aux attaques par analyse
-    # de temps, car elle compare les chaînes de caractères de manière à prendre toujours le même temps,
-    # indépendamment du nombre de caractères qui correspondent.
-    # Cela empêche les attaquants de pouvoir deviner le mot de passe basé sur le temps que prend
-    # la comparaison, ajoutant ainsi une couche supplémentaire de sécurité.
-    assert secrets.compare_digest(hachage_1, hachage_2)
-
-    # Teste que deux mots de passe différents produisent des hachages différents.
-    mot_de_passe_1 = "secret"
-    mot_de_passe_2 = "secret2"
-    hachage_1 = hacher_mot_de_passe(mot_de_passe_1)
-    hachage_2 = hacher_mot_de_passe(mot_de_passe_2)
-    assert not secrets.compare_digest(hachage_1, hachage_2)
+    assert hachage_1 != hachage_2
+    assert verifier_mot_de_passe(mot_de_passe, hachage_1)
+    assert verifier_mot_de_passe(mot_de_passe, hachage_2)
+
+    # Teste qu'un mauvais mot de passe est rejeté.
+    hachage = hacher_mot_de_passe("secret")
+    assert not verifier_mot_de_passe("secret2", hachage)
+
+    # Teste qu'un hachage SHA-256 hérité reste accepté.
+    hachage_herite = _sha256("secret".encode()).hexdigest()
+    assert verifier_mot_de_passe("secret", hachage_herite)
+    assert not verifier_mot_de_passe("secret2", hachage_herite)
+
+    # Teste qu'un hachage vide ou absent est rejeté.
+    assert not verifier_mot_de_passe("secret", "")
+    assert not verifier_mot_de_passe("secret", None)
 
     # Teste le comportement de la fonction avec un mot de passe vide.
     mot_de_passe = ""
-    assert hacher_mot_de_passe(mot_de_passe) is not None
-    assert len(hacher_mot_de_passe(mot_de_passe)) == 64
+    assert verifier_mot_de_passe(mot_de_passe, hacher_mot_de_passe(mot_de_passe))
 
     # Teste le comportement de la fonction avec un très long mot de passe.
     mot_de_passe = "a" * 1000  # Un mot de passe de 1000 caractères 'a'
-    assert hacher_mot_de_passe(mot_de_passe) is not None
-    assert len(hacher_mot_de_passe(mot_de_passe)) == 64
+    assert verifier_mot_de_passe(mot_de_passe, hacher_mot_de_passe(mot_de_passe))
 
 
 def tests_formater_argent():